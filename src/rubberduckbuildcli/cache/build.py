@@ -0,0 +1,86 @@
+import os
+import shutil
+import tempfile
+from pathlib import Path
+
+from .client import RemoteCache, input_hash
+from .exceptions import CacheError, CacheIntegrityError
+from ..helpers.events import events
+from ..languages import LanguageBackend
+from ..projects.exceptions import ProjectLintError
+
+
+class CachedBuild:
+    """
+    Build through the remote cache, falling back to a local build whenever
+    the cache misses, is unavailable or returns content that fails its
+    integrity check.
+    """
+    def __init__(self, backend: LanguageBackend, remote_cache: RemoteCache, project_path: str | None = None):
+        self.backend = backend
+        self.remote_cache = remote_cache
+        self.project_path = project_path or os.getcwd()
+        self.dist_dir = Path(self.project_path) / "dist"
+
+    def build(self) -> list[Path]:
+        key = input_hash(self.project_path, self.backend.name)
+        try:
+            with events.phase("cache.lookup"):
+                manifest = self.remote_cache.get_manifest(key)
+        except CacheIntegrityError as error:
+            # Rebuild and upload so the unusable entry gets replaced
+            print(f"Cached build unusable, building locally: {error}")
+            manifest = None
+        except CacheError as error:
+            events.cache("remote-build", "unavailable", key)
+            print(f"Remote cache unavailable, building locally: {error}")
+            return self.backend.build()
+
+        if manifest:
+            events.cache("remote-build", "hit", key)
+            with events.phase("cache.restore"):
+                artifacts = self.restore(manifest)
+            if artifacts is not None:
+                return artifacts
+        else:
+            events.cache("remote-build", "miss", key)
+
+        try:
+            artifacts = self.backend.build()
+        except ProjectLintError as error:
+            lint_output = error.output
+            self.upload(lambda: self.remote_cache.upload_lint_failure(key, lint_output))
+            raise
+        self.upload(lambda: self.remote_cache.upload_build(key, artifacts))
+        return artifacts
+
+    def restore(self, manifest: dict) -> list[Path] | None:
+        """
+        Replay a cached build, returning None when it can't be used.
+        """
+        lint = manifest.get("lint", {})
+        if lint.get("status") == "failed":
+            print(lint.get("output", ""))
+            raise ProjectLintError("Ruff Checks Failed (cached result)", output=lint.get("output", ""))
+
+        self.dist_dir.mkdir(exist_ok=True)
+        # Download next to dist/ so a failed or partial download never lands in it
+        with tempfile.TemporaryDirectory(prefix=".rubberduck-cache-", dir=self.project_path) as out_dir:
+            try:
+                downloaded = self.remote_cache.download_artifacts(manifest, Path(out_dir))
+            except CacheError as error:
+                print(f"Cached build unusable, building locally: {error}")
+                return None
+            artifacts = []
+            for artifact in downloaded:
+                shutil.move(artifact, self.dist_dir / artifact.name)
+                artifacts.append(self.dist_dir / artifact.name)
+                print(f"Restored {artifact.name} from remote cache")
+        return artifacts
+
+    def upload(self, upload):
+        try:
+            with events.phase("cache.upload"):
+                upload()
+        except CacheError as error:
+            print(f"Could not upload build to remote cache: {error}")
@@ -0,0 +1,30 @@
+from pathlib import Path
+from typing import Optional
+
+import typer
+
+app = typer.Typer()
+
+
+@app.command("serve")
+def serve(host: str = "127.0.0.1", port: int = 8765, directory: Optional[str] = None, quiet: bool = False):
+    """
+    Run the reference remote cache server.
+    """
+    # Imported here so other commands don't pay for http.server
+    from .server import CacheServer
+
+    if directory is None:
+        directory = str(Path(typer.get_app_dir("rubberduckbuildcli")) / "cache-server")
+    server = CacheServer(host, port, directory, verbose=not quiet)
+    print(f"Serving build cache from {directory} on http://{host}:{server.server_port}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+
+
+if __name__=="__main__":
+    app()
@@ -0,0 +1,195 @@
+import hashlib
+import json
+import os
+import re
+import subprocess
+import urllib.error
+import urllib.request
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import typer
+
+from .exceptions import CacheError, CacheIntegrityError, CacheUnavailableError
+
+CACHE_VERSION = 1
+
+SHA256_PATTERN = re.compile(r"^[0-9a-f]{64}$")
+
+# Directories that are build outputs or tool state rather than build inputs
+IGNORED_DIRECTORIES = {"dist", "build", "__pycache__", "node_modules"}
+
+
+def sha256_file(path: Path) -> str:
+    digest = hashlib.sha256()
+    with open(path, 'rb') as file:
+        for chunk in iter(lambda: file.read(1024 * 1024), b""):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def is_input_directory(name: str) -> bool:
+    return not name.startswith(".") and name not in IGNORED_DIRECTORIES and not name.endswith(".egg-info")
+
+
+def input_files(project_path: str) -> list[str]:
+    """
+    Files below project_path that are build inputs, relative and sorted.
+
+    In a git checkout these are the tracked and untracked but not ignored
+    files, so virtual environments and data listed in .gitignore don't count.
+    Elsewhere every file is used. Either way hidden directories and build
+    outputs are left out.
+    """
+    try:
+        result = subprocess.run(
+            ["git", "ls-files", "-z", "--cached", "--others", "--exclude-standard"],
+            cwd=project_path, capture_output=True, check=True,
+        )
+    except (OSError, subprocess.CalledProcessError):
+        result = None
+    if result is not None:
+        files = [name for name in os.fsdecode(result.stdout).split("\0") if name]
+        # Tracked files deleted from the working tree are still listed
+        return sorted({name for name in files
+                       if all(is_input_directory(part) for part in name.split("/")[:-1])
+                       and os.path.isfile(os.path.join(project_path, name))})
+
+    files = []
+    for directory, dirnames, filenames in os.walk(project_path):
+        dirnames[:] = [name for name in dirnames if is_input_directory(name)]
+        files.extend(os.path.relpath(os.path.join(directory, name), project_path).replace(os.sep, "/")
+                     for name in filenames)
+    return sorted(files)
+
+
+def input_hash(project_path: str, backend_name: str) -> str:
+    """
+    Hash of everything a build depends on: the backend and every input file
+    below project_path (see input_files).
+    """
+    digest = hashlib.sha256(f"rubberduck-cache-v{CACHE_VERSION}\0{backend_name}\0".encode())
+    for relative in input_files(project_path):
+        digest.update(relative.encode() + b"\0")
+        digest.update(sha256_file(Path(project_path) / relative).encode() + b"\0")
+    return digest.hexdigest()
+
+
+def checked_artifact_name(name) -> str:
+    """
+    Artifact names become file names in dist/, so only plain basenames are accepted.
+    """
+    if (not isinstance(name, str) or not name
+            or "/" in name or "\\" in name or ".." in name or name != Path(name).name):
+        raise CacheIntegrityError(f"Invalid artifact name {name!r}")
+    return name
+
+
+class RemoteCache:
+    """
+    Client for the remote build cache.
+
+    The protocol is plain HTTP:
+
+        GET/PUT/HEAD /cas/<sha256>      content addressed blobs (dist/ artifacts)
+        GET/PUT      /ac/<input hash>   JSON manifest of a build: lint result
+                                        and the digests of its artifacts
+
+    Blobs are uploaded before the manifest referencing them, so a manifest
+    that can be read always points at complete content.
+    """
+    def __init__(self, url: str, timeout: float = 10, max_workers: int = 8):
+        self.url = url.rstrip("/")
+        self.timeout = timeout
+        self.max_workers = max_workers
+
+    @classmethod
+    def from_personal_config(cls) -> 'RemoteCache | None':
+        """
+        Remote cache from RUBBERDUCK_CACHE_URL or the cache.url personal
+        configuration, None when neither is set.
+        """
+        url = os.environ.get("RUBBERDUCK_CACHE_URL")
+        if url is None:
+            app_dir = typer.get_app_dir("rubberduckbuildcli")
+            config_path: Path = Path(app_dir) / "config.json"
+            try:
+                with open(config_path, 'r') as file:
+                    url = json.load(file).get("cache", {}).get("url")
+            except (OSError, ValueError):
+                url = None
+        return cls(url) if url else None
+
+    def _request(self, method: str, path: str, data: bytes | None = None) -> bytes | None:
+        request = urllib.request.Request(f"{self.url}{path}", data=data, method=method)
+        if data is not None:
+            request.add_header("Content-Type", "application/octet-stream")
+        try:
+            with urllib.request.urlopen(request, timeout=self.timeout) as response:
+                return response.read()
+        except urllib.error.HTTPError as error:
+            if error.code == 404:
+                return None
+            raise CacheError(f"{method} {path} failed: {error.code} {error.reason}") from error
+        except (urllib.error.URLError, OSError) as error:
+            raise CacheUnavailableError(f"Remote cache {self.url} unavailable: {error}") from error
+
+    def get_manifest(self, key: str) -> dict | None:
+        content = self._request("GET", f"/ac/{key}")
+        if content is None:
+            return None
+        try:
+            manifest = json.loads(content)
+        except ValueError as error:
+            raise CacheIntegrityError(f"Corrupt manifest for {key}") from error
+        if not isinstance(manifest, dict):
+            raise CacheIntegrityError(f"Malformed manifest for {key}")
+        if manifest.get("version") != CACHE_VERSION:
+            return None
+        lint, artifacts = manifest.get("lint"), manifest.get("artifacts")
+        if (not isinstance(lint, dict) or not isinstance(lint.get("output", ""), str)
+                or not isinstance(artifacts, list)
+                or not all(isinstance(artifact, dict) for artifact in artifacts)):
+            raise CacheIntegrityError(f"Malformed manifest for {key}")
+        return manifest
+
+    def put_manifest(self, key: str, manifest: dict):
+        self._request("PUT", f"/ac/{key}", json.dumps({**manifest, "version": CACHE_VERSION}).encode())
+
+    def _download(self, artifact: dict, out_dir: Path) -> Path:
+        name = checked_artifact_name(artifact.get("name"))
+        if not SHA256_PATTERN.match(str(artifact.get("sha256", ""))):
+            raise CacheIntegrityError(f"Invalid digest for {name}")
+        content = self._request("GET", f"/cas/{artifact['sha256']}")
+        if content is None:
+            raise CacheIntegrityError(f"Missing blob {artifact['sha256']} for {name}")
+        if hashlib.sha256(content).hexdigest() != artifact["sha256"]:
+            raise CacheIntegrityError(f"Digest mismatch for {name}")
+        target = out_dir / name
+        target.write_bytes(content)
+        return target
+
+    def _upload(self, artifact: dict, path: Path):
+        # Skip content the cache already holds
+        if self._request("HEAD", f"/cas/{artifact['sha256']}") is not None:
+            return
+        self._request("PUT", f"/cas/{artifact['sha256']}", path.read_bytes())
+
+    def download_artifacts(self, manifest: dict, out_dir: Path) -> list[Path]:
+        """
+        Download and verify every artifact of the manifest concurrently into out_dir.
+        """
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            return list(executor.map(lambda artifact: self._download(artifact, out_dir), manifest["artifacts"]))
+
+    def upload_build(self, key: str, artifacts: list[Path], lint_output: str = ""):
+        """
+        Upload the artifacts concurrently, then the manifest that references them.
+        """
+        entries = [{"name": checked_artifact_name(path.name), "sha256": sha256_file(path), "size": path.stat().st_size} for path in artifacts]
+        with ThreadPoolExecutor(max_workers=self.max_workers) as executor:
+            list(executor.map(self._upload, entries, artifacts))
+        self.put_manifest(key, {"lint": {"status": "passed", "output": lint_output}, "artifacts": entries})
+
+    def upload_lint_failure(self, key: str, lint_output: str):
+        self.put_manifest(key, {"lint": {"status": "failed", "output": lint_output}, "artifacts": []})
@@ -0,0 +1,14 @@
+class CacheError(Exception):
+    """
+    Base Remote Cache Exception
+    """
+
+class CacheUnavailableError(CacheError):
+    """
+    Raised when the Remote Cache can't be Reached
+    """
+
+class CacheIntegrityError(CacheError):
+    """
+    Raised when Downloaded Content doesn't Match its Digest
+    """
@@ -0,0 +1,86 @@
+import hashlib
+import os
+import re
+import tempfile
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from pathlib import Path
+
+PATH_PATTERN = re.compile(r"^/(cas|ac)/([0-9a-f]{64})$")
+
+
+class CacheRequestHandler(BaseHTTPRequestHandler):
+    """
+    Reference implementation of the remote cache protocol, storing entries
+    as files below the server's storage directory.
+    """
+    server_version = "RubberDuckCache/1"
+
+    def _entry_path(self) -> tuple[str, str, Path] | None:
+        match = PATH_PATTERN.match(self.path)
+        if not match:
+            self.send_error(404, "Unknown cache path")
+            return None
+        namespace, key = match.groups()
+        return namespace, key, self.server.storage / namespace / key[:2] / key
+
+    def _send_file(self, include_body: bool):
+        entry = self._entry_path()
+        if entry is None:
+            return
+        namespace, key, path = entry
+        try:
+            content = path.read_bytes()
+        except FileNotFoundError:
+            self.send_error(404, "Not cached")
+            return
+        if namespace == "cas" and hashlib.sha256(content).hexdigest() != key:
+            # Drop corrupted blobs so the next upload replaces them
+            path.unlink(missing_ok=True)
+            self.send_error(404, "Not cached")
+            return
+        self.send_response(200)
+        self.send_header("Content-Type", "application/octet-stream")
+        self.send_header("Content-Length", str(len(content)))
+        self.end_headers()
+        if include_body:
+            self.wfile.write(content)
+
+    def do_GET(self):
+        self._send_file(include_body=True)
+
+    def do_HEAD(self):
+        self._send_file(include_body=False)
+
+    def do_PUT(self):
+        entry = self._entry_path()
+        if entry is None:
+            return
+        namespace, key, path = entry
+        length = self.headers.get("Content-Length")
+        if length is None:
+            self.send_error(411, "Content-Length required")
+            return
+        content = self.rfile.read(int(length))
+        if namespace == "cas" and hashlib.sha256(content).hexdigest() != key:
+            self.send_error(400, "Content does not match its digest")
+            return
+        path.parent.mkdir(parents=True, exist_ok=True)
+        # Write next to the target and rename so readers never see partial content
+        with tempfile.NamedTemporaryFile(dir=path.parent, delete=False) as tmp_file:
+            tmp_file.write(content)
+        os.replace(tmp_file.name, path)
+        self.send_response(201)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def log_message(self, format, *args):
+        if self.server.verbose:
+            super().log_message(format, *args)
+
+
+class CacheServer(ThreadingHTTPServer):
+    def __init__(self, host: str, port: int, storage: str, verbose: bool = True):
+        super().__init__((host, port), CacheRequestHandler)
+        self.storage = Path(storage)
+        self.storage.mkdir(parents=True, exist_ok=True)
+        self.verbose = verbose
@@ -0,0 +1,30 @@
+import typer
+
+from .index import CompletionIndex
+
+app = typer.Typer()
+
+
+@app.command("build")
+def build_index(ctx: typer.Context):
+    """
+    Write the static completion index for the commands, options and the
+    ExtraCommands of the project in the current directory, keeping those of
+    the projects it was built in before.
+    """
+    completion_index = CompletionIndex()
+    index_path = completion_index.build(ctx.find_root())
+    print(f"Completion index written to {index_path}")
+
+
+@app.command("script")
+def show_script(shell: str = typer.Argument("bash", help="bash or zsh")):
+    """
+    Print the completion script that reads the static index.
+    """
+    completion_index = CompletionIndex()
+    print(completion_index.script(shell))
+
+
+if __name__=="__main__":
+    app()
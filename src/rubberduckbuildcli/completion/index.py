@@ -0,0 +1,268 @@
+import os
+import sys
+from pathlib import Path
+
+import typer
+
+from ..helpers.files import write_text_atomic
+from ..projects.configurations import BaseProjectConfiguration
+
+INDEX_HEADER = "#rubberduck-completion"
+INDEX_VERSION = "2"
+TASKS_COMMAND = ("project", "run")
+
+
+class CompletionIndex:
+    """
+    Static completion index read directly by the shell completion scripts.
+
+    The index is a tab separated text file so the shell can parse it with
+    ``read`` alone, without starting Python:
+
+        #rubberduck-completion  <version>
+        @watch                  <file>        (one line per watched file)
+        @tasks-command          <command path completing task names>
+        @tasks                  <RubberDuckProject.json path> <task names>
+        <command path>          <candidates>  <options taking a value>
+
+    There is one @tasks line for every project the index was built in, so
+    switching between checkouts keeps completing from the index. The index
+    is stale once a watched file is newer than it, and a project's task
+    names once its RubberDuckProject.json is.
+    """
+
+    def __init__(self, prog_name: str = "rubberduck"):
+        self.prog_name = prog_name
+        app_dir = typer.get_app_dir("rubberduckbuildcli")
+        self.index_path: Path = Path(app_dir) / "completion-index.tsv"
+
+    def collect_commands(self, ctx: typer.Context) -> tuple[dict[str, tuple[list[str], list[str]]], set[str]]:
+        """
+        Walk the command tree below ctx and return the candidates for every
+        command path along with the source files the commands are defined in.
+        """
+        entries = {}
+        sources = set()
+
+        def walk(command, command_ctx, path):
+            candidates = []
+            value_options = []
+            if hasattr(command, "list_commands"):
+                for name in command.list_commands(command_ctx):
+                    sub_command = command.get_command(command_ctx, name)
+                    if sub_command is None or sub_command.hidden:
+                        continue
+                    candidates.append(name)
+                    sub_ctx = typer.Context(sub_command, info_name=name, parent=command_ctx)
+                    walk(sub_command, sub_ctx, f"{path} {name}")
+            for param in command.get_params(command_ctx):
+                if param.param_type_name != "option" or param.hidden:
+                    continue
+                candidates.extend(param.opts + param.secondary_opts)
+                if not param.is_flag:
+                    value_options.extend(param.opts)
+            if command.callback is not None:
+                module = sys.modules.get(command.callback.__module__)
+                if getattr(module, "__file__", None):
+                    sources.add(os.path.abspath(module.__file__))
+            entries[path] = (candidates, value_options)
+
+        walk(ctx.command, ctx, self.prog_name)
+        return entries, sources
+
+    def indexed_projects(self) -> list[str]:
+        """
+        Project files the existing index holds task names for
+        """
+        try:
+            with open(self.index_path, "r") as index_file:
+                if index_file.readline().rstrip("\n") != f"{INDEX_HEADER}\t{INDEX_VERSION}":
+                    return []
+                return [line.split("\t")[1] for line in index_file if line.startswith("@tasks\t")]
+        except OSError:
+            return []
+
+    def collect_tasks(self) -> dict[str, list[str]]:
+        """
+        Task names of the project in the current directory and of every
+        project already in the index, re-read so that all of them are current
+        as of this build. Projects that no longer exist are dropped.
+        """
+        project_files = set(self.indexed_projects())
+        current = BaseProjectConfiguration()
+        if current.config_exists(throw_error=False):
+            project_files.add(current.project_config_file_path)
+
+        project_tasks = {}
+        for project_file in project_files:
+            project_config = BaseProjectConfiguration(os.path.dirname(project_file))
+            if not project_config.config_exists(throw_error=False):
+                continue
+            try:
+                project_tasks[project_file] = project_config.extra_command_names()
+            except (OSError, ValueError):
+                # An invalid project file falls back to the Python completion
+                continue
+        return project_tasks
+
+    def build(self, ctx: typer.Context) -> Path:
+        """
+        Build the completion index for the command tree rooted at ctx and the
+        ExtraCommands of the project in the current directory.
+        """
+        entries, sources = self.collect_commands(ctx)
+
+        # The console script is rewritten on every install/upgrade of the CLI
+        script_path = Path(sys.argv[0]).resolve()
+        if script_path.is_file():
+            sources.add(str(script_path))
+
+        project_tasks = self.collect_tasks()
+
+        lines = [f"{INDEX_HEADER}\t{INDEX_VERSION}"]
+        lines.extend(f"@watch\t{source}" for source in sorted(sources))
+        lines.append(f"@tasks-command\t{' '.join((self.prog_name,) + TASKS_COMMAND)}")
+        lines.extend(f"@tasks\t{project_file}\t{' '.join(tasks)}" for project_file, tasks in sorted(project_tasks.items()))
+        for path, (candidates, value_options) in entries.items():
+            lines.append(f"{path}\t{' '.join(candidates)}\t{' '.join(value_options)}")
+
+        # A shell never reads a partial index
+        write_text_atomic(self.index_path, "\n".join(lines) + "\n")
+        return self.index_path
+
+    def script(self, shell: str) -> str:
+        """
+        Shell script that completes from the index and falls back to the
+        Python completion when the index is missing or stale.
+        """
+        scripts = {
+            "bash": COMPLETION_SCRIPT_BASH,
+            "zsh": COMPLETION_SCRIPT_ZSH,
+        }
+        if shell not in scripts:
+            raise typer.BadParameter(f"Unsupported shell {shell}, expected one of: {', '.join(scripts)}")
+        complete_func = "_" + self.prog_name.replace("-", "_") + "_completion"
+        return scripts[shell].strip() % {
+            "complete_func": complete_func,
+            "prog_name": self.prog_name,
+            "complete_var": "_" + self.prog_name.replace("-", "_").upper() + "_COMPLETE",
+            "index_path": str(self.index_path),
+        }
+
+
+COMPLETION_SCRIPT_BASH = r"""
+%(complete_func)s_index() {
+    local idx='%(index_path)s' cur="${COMP_WORDS[COMP_CWORD]}"
+    local tag version key cands vals project='' tasks_path='' tasks='' cmd_path='%(prog_name)s' skip=0 i w
+    local -A candidates value_options
+    [[ -r "$idx" ]] || return 1
+    {
+        IFS=$'\t' read -r tag version
+        [[ "$tag" == '#rubberduck-completion' && "$version" == 2 ]] || return 1
+        while IFS=$'\t' read -r key cands vals; do
+            case "$key" in
+                @watch) [[ "$cands" -nt "$idx" ]] && return 1 ;;
+                @tasks-command) tasks_path="$cands" ;;
+                @tasks) [[ "$cands" == "$PWD/RubberDuckProject.json" ]] && project="$cands" tasks="$vals" ;;
+                *) candidates["$key"]="$cands"; value_options["$key"]="$vals" ;;
+            esac
+        done
+    } < "$idx"
+
+    for (( i=1; i<COMP_CWORD; i++ )); do
+        w="${COMP_WORDS[i]}"
+        if (( skip )); then
+            skip=0
+        elif [[ "$w" == -* ]]; then
+            [[ " ${value_options[$cmd_path]} " == *" $w "* ]] && skip=1
+        elif [[ -n "${candidates[$cmd_path $w]+set}" ]]; then
+            cmd_path="$cmd_path $w"
+        fi
+    done
+
+    COMPREPLY=()
+    # Option values are left to the default (file name) completion
+    (( skip )) && return 0
+    if [[ "$cmd_path" == "$tasks_path" && "$cur" != -* ]]; then
+        if [[ -f "$PWD/RubberDuckProject.json" ]]; then
+            [[ "$project" == "$PWD/RubberDuckProject.json" && ! "$project" -nt "$idx" ]] || return 1
+        else
+            tasks=''
+        fi
+    else
+        tasks=''
+    fi
+    local IFS=$' \t\n'
+    COMPREPLY=( $(compgen -W "${candidates[$cmd_path]} $tasks" -- "$cur") )
+    return 0
+}
+
+%(complete_func)s() {
+    %(complete_func)s_index && return 0
+    local IFS=$'\n'
+    COMPREPLY=( $( env COMP_WORDS="${COMP_WORDS[*]}" \
+                   COMP_CWORD=$COMP_CWORD \
+                   %(complete_var)s=complete_bash $1 ) )
+    return 0
+}
+
+complete -o default -F %(complete_func)s %(prog_name)s
+"""
+
+COMPLETION_SCRIPT_ZSH = r"""
+#compdef %(prog_name)s
+
+%(complete_func)s_index() {
+  local idx='%(index_path)s' cur="${words[CURRENT]}"
+  local tag version key cands vals project='' tasks_path='' tasks='' cmd_path='%(prog_name)s' skip=0 i w
+  local -A candidates value_options
+  [[ -r "$idx" ]] || return 1
+  {
+    IFS=$'\t' read -r tag version
+    [[ "$tag" == '#rubberduck-completion' && "$version" == 2 ]] || return 1
+    while IFS=$'\t' read -r key cands vals; do
+      case "$key" in
+        @watch) [[ "$cands" -nt "$idx" ]] && return 1 ;;
+        @tasks-command) tasks_path="$cands" ;;
+        @tasks) [[ "$cands" == "$PWD/RubberDuckProject.json" ]] && project="$cands" tasks="$vals" ;;
+        *) candidates[$key]="$cands"; value_options[$key]="$vals" ;;
+      esac
+    done
+  } < "$idx"
+
+  for (( i=2; i<CURRENT; i++ )); do
+    w="${words[i]}"
+    if (( skip )); then
+      skip=0
+    elif [[ "$w" == -* ]]; then
+      [[ " ${value_options[$cmd_path]} " == *" $w "* ]] && skip=1
+    elif (( ${+candidates[$cmd_path $w]} )); then
+      cmd_path="$cmd_path $w"
+    fi
+  done
+
+  # Option values are left to the default (file name) completion
+  if (( skip )); then
+    _files
+    return 0
+  fi
+  if [[ "$cmd_path" == "$tasks_path" && "$cur" != -* ]]; then
+    if [[ -f "$PWD/RubberDuckProject.json" ]]; then
+      [[ "$project" == "$PWD/RubberDuckProject.json" && ! "$project" -nt "$idx" ]] || return 1
+    else
+      tasks=''
+    fi
+  else
+    tasks=''
+  fi
+  compadd -- ${=candidates[$cmd_path]} ${=tasks}
+  return 0
+}
+
+%(complete_func)s() {
+  %(complete_func)s_index && return 0
+  eval $(env _TYPER_COMPLETE_ARGS="${words[1,$CURRENT]}" %(complete_var)s=complete_zsh %(prog_name)s)
+}
+
+compdef %(complete_func)s %(prog_name)s
+"""
@@ -0,0 +1,59 @@
+import hashlib
+import os
+from pathlib import Path
+
+
+class EnvironmentFingerprint:
+    """
+    Fingerprint of the inputs uv syncs the project environment from.
+
+    The fingerprint is stored inside the virtual environment, so removing or
+    recreating the environment also drops it.
+    """
+    FINGERPRINT_FILE = ".rubberduck-fingerprint"
+
+    def __init__(self, project_path: str | None = None):
+        self.project_path = Path(project_path or os.getcwd())
+        self.venv_path = self.project_path / os.environ.get("UV_PROJECT_ENVIRONMENT", ".venv")
+        self.fingerprint_path = self.venv_path / self.FINGERPRINT_FILE
+
+    def compute(self) -> str:
+        """
+        Hash uv.lock, pyproject.toml and the interpreter the environment uses.
+        """
+        digest = hashlib.sha256()
+        for name in ("uv.lock", "pyproject.toml", ".python-version"):
+            self._update(digest, name, self.project_path / name)
+        # pyvenv.cfg records the interpreter the venv was created from
+        self._update(digest, "pyvenv.cfg", self.venv_path / "pyvenv.cfg")
+        digest.update(f"UV_PYTHON={os.environ.get('UV_PYTHON', '')}".encode())
+        return digest.hexdigest()
+
+    def _update(self, digest, name: str, path: Path):
+        digest.update(name.encode() + b"\0")
+        try:
+            digest.update(path.read_bytes())
+        except FileNotFoundError:
+            digest.update(b"<missing>")
+        digest.update(b"\0")
+
+    def matches(self) -> bool:
+        """
+        True when the environment was synced from the current inputs.
+        """
+        try:
+            recorded = self.fingerprint_path.read_text().strip()
+        except (FileNotFoundError, NotADirectoryError):
+            return False
+        return recorded == self.compute()
+
+    def record(self):
+        """
+        Record the fingerprint after a successful sync.
+        """
+        if not self.venv_path.is_dir():
+            return
+        self.fingerprint_path.write_text(self.compute() + "\n")
+
+    def clear(self):
+        self.fingerprint_path.unlink(missing_ok=True)
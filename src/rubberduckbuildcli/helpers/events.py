@@ -0,0 +1,145 @@
+import io
+import itertools
+import json
+import os
+import sys
+import threading
+import time
+from contextlib import contextmanager
+from enum import Enum
+
+SCHEMA_VERSION = 1
+
+
+class EventFormat(str, Enum):
+    ndjson = "ndjson"
+
+
+class EventStream:
+    """
+    Machine readable event stream, written as one JSON object per line.
+
+    Every event carries ``schema``, ``seq`` (per invocation), ``ts`` (unix
+    time) and ``type``. The types and their extra fields are:
+
+        command.start   command, argv, pid
+        command.end     command, exit_code, duration, error (optional)
+        process.start   process, argv, name
+        process.output  process, stream (stdout/stderr), data
+        process.end     process, exit_code, duration, cancelled
+        phase.start     phase
+        phase.end       phase, status (ok/error), duration
+        cache           cache, result (hit/miss/unavailable), key (optional)
+        log             stream, message
+        project         the fields of a project list/find result
+
+    Fields are only ever added to an event type within a schema version.
+    While the stream is open, rich rendering is skipped and anything printed
+    to stdout is forwarded as ``log`` events.
+    """
+    def __init__(self):
+        self.file = None
+        self.command = None
+        self.started = None
+        self._lock = threading.Lock()
+        self._seq = itertools.count(1)
+        self._process_ids = itertools.count(1)
+
+    @property
+    def enabled(self) -> bool:
+        return self.file is not None
+
+    def open(self, fd: int, command: str | None = None, argv: list[str] | None = None):
+        # Duplicate the descriptor so replacing sys.stdout can't close it
+        self.file = os.fdopen(os.dup(fd), "w", buffering=1, encoding="utf-8")
+        self.command = command
+        self.started = time.monotonic()
+        sys.stdout = LogEventWriter(self, "stdout")
+        self.emit("command.start", command=command, argv=argv if argv is not None else sys.argv[1:], pid=os.getpid())
+
+    def emit(self, event_type: str, **fields):
+        if self.file is None:
+            return
+        with self._lock:
+            if self.file is None:
+                return
+            event = {"schema": SCHEMA_VERSION, "seq": next(self._seq), "ts": time.time(), "type": event_type, **fields}
+            try:
+                self.file.write(json.dumps(event, separators=(",", ":"), default=str) + "\n")
+            except OSError:
+                # The consumer went away (e.g. a closed pipe); stop streaming rather than fail the command
+                self.file = None
+
+    def close(self, exit_code: int, error: BaseException | None = None):
+        """
+        Emit command.end and stop the stream; a no-op when it isn't open.
+        """
+        if self.file is None:
+            return
+        if isinstance(sys.stdout, LogEventWriter):
+            sys.stdout.flush()
+            sys.stdout = sys.__stdout__
+        fields = {"command": self.command, "exit_code": exit_code, "duration": time.monotonic() - self.started}
+        if error is not None:
+            fields["error"] = {"type": type(error).__name__, "message": str(error)}
+        self.emit("command.end", **fields)
+        if self.file is not None:
+            try:
+                self.file.close()
+            except OSError:
+                pass
+            self.file = None
+
+    def next_process_id(self) -> int:
+        return next(self._process_ids)
+
+    def cache(self, cache: str, result: str, key: str | None = None):
+        fields = {"cache": cache, "result": result}
+        if key is not None:
+            fields["key"] = key
+        self.emit("cache", **fields)
+
+    @contextmanager
+    def phase(self, name: str):
+        if self.file is None:
+            yield
+            return
+        started = time.monotonic()
+        self.emit("phase.start", phase=name)
+        status = "error"
+        try:
+            yield
+            status = "ok"
+        finally:
+            self.emit("phase.end", phase=name, status=status, duration=time.monotonic() - started)
+
+
+class LogEventWriter(io.TextIOBase):
+    """
+    Text stream that forwards each written line as a log event.
+    """
+    def __init__(self, stream: EventStream, name: str):
+        self.stream = stream
+        self.name = name
+        self._buffer = ""
+
+    def writable(self) -> bool:
+        return True
+
+    def isatty(self) -> bool:
+        return False
+
+    def write(self, text: str) -> int:
+        self._buffer += text
+        *lines, self._buffer = self._buffer.split("\n")
+        for line in lines:
+            self.stream.emit("log", stream=self.name, message=line)
+        return len(text)
+
+    def flush(self):
+        if self._buffer:
+            self.stream.emit("log", stream=self.name, message=self._buffer)
+            self._buffer = ""
+
+
+events = EventStream()
@@ -0,0 +1,30 @@
+import json
+import os
+from pathlib import Path
+
+
+def write_text_atomic(path: Path, text: str):
+    """
+    Write text to path so readers only ever see the old or the new content.
+
+    The content goes to a temporary file named after this process next to
+    path and is then renamed over it, so concurrent writers never rename
+    each other's partial files.
+    """
+    path = Path(path)
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        with open(tmp_path, 'w') as tmp_file:
+            tmp_file.write(text)
+        os.replace(tmp_path, path)
+    except BaseException:
+        tmp_path.unlink(missing_ok=True)
+        raise
+
+
+def write_json_atomic(path: Path, data, indent: int | None = None):
+    """
+    Write data as JSON to path, see write_text_atomic
+    """
+    write_text_atomic(path, json.dumps(data, indent=indent))
@@ -1,9 +1,17 @@
+import os
 import subprocess
+import queue
+import threading
+import time
 
 from rich.console import Console
+from rich.text import Text
 import sys
 import signal
 
+from .environment import EnvironmentFingerprint
+from .events import events
+
 class UVExecution:
     def __init__(self):
         self.console = Console()
@@ -18,16 +26,16 @@ class UVExecution:
         # Define signal handler for Ctrl+C
         def signal_handler(sig, frame):
             if self.process:
-                self.console.print("\n[bold yellow]Received interrupt signal. Terminating UV process...[/]")
+                self.notice("\n[bold yellow]Received interrupt signal. Terminating UV process...[/]")
                 self.process.terminate()
                 try:
                     # Wait for process to terminate, with timeout
                     self.process.wait(timeout=2)
                 except subprocess.TimeoutExpired:
                     # Force kill if it doesn't terminate gracefully
-                    self.console.print("[bold red]Process didn't terminate gracefully. Forcing exit...[/]")
+                    self.notice("[bold red]Process didn't terminate gracefully. Forcing exit...[/]")
                     self.process.kill()
-                self.console.print("[bold yellow]UV process terminated.[/]")
+                self.notice("[bold yellow]UV process terminated.[/]")
                 sys.exit(130)  # 130 is the standard exit code for Ctrl+C
         
         # Set up the signal handler
@@ -45,9 +53,8 @@ class UVExecution:
             )
             
             # Print header for the command
-            self.console.print(f"[bold cyan]======================[/]")
-            self.console.print(f"[bold cyan]Running UV command:[/] {' '.join(['uv'] + args)}")
-            self.console.print(f"[bold cyan]======================[/]")
+            started = time.monotonic()
+            process_id = self.print_header(args)
             
             # Read stdout and stderr in real-time
             while True:
@@ -55,28 +62,26 @@ class UVExecution:
                 stderr_line = self.process.stderr.readline()
                 
                 if stdout_line:
-                    self.console.print(stdout_line.rstrip())
+                    self.print_output(process_id, "stdout", stdout_line)
                 if stderr_line:
-                    self.console.print(f"[bold red]{stderr_line.rstrip()}[/]")
+                    self.print_output(process_id, "stderr", stderr_line)
                     
                 # Check if process has terminated
                 if self.process.poll() is not None:
                     # Get any remaining output
                     for line in self.process.stdout.readlines():
-                        self.console.print(line.rstrip())
+                        self.print_output(process_id, "stdout", line)
                     for line in self.process.stderr.readlines():
-                        self.console.print(f"[bold red]{line.rstrip()}[/]")
+                        self.print_output(process_id, "stderr", line)
                     break
             
             # Print footer with return code
-            self.console.print(f"[bold cyan]======================[/]")
-            self.console.print(f"[bold cyan]Command completed with return code:[/] {self.process.returncode}")
-            self.console.print(f"[bold cyan]======================[/]")
+            self.print_footer(self.process.returncode, process_id, time.monotonic() - started)
             
             return self.process.returncode
             
         except FileNotFoundError:
-            self.console.print("[bold red]Error:[/] UV is not installed or not in PATH")
+            self.notice("[bold red]Error:[/] UV is not installed or not in PATH")
             return 1
         finally:
             # Restore the original signal handler
@@ -84,6 +89,191 @@ class UVExecution:
             # Clean up process reference
             self.process = None
 
+    def notice(self, message: str):
+        """
+        Print a rich formatted message, or emit it as a log event
+        """
+        if events.enabled:
+            events.emit("log", stream="stderr", message=Text.from_markup(message).plain.strip())
+        else:
+            self.console.print(message)
+
+    def print_header(self, args: list[str], name: str | None = None) -> int | None:
+        """
+        Announce a UV command, returning its process id in the event stream
+        """
+        if events.enabled:
+            process_id = events.next_process_id()
+            events.emit("process.start", process=process_id, argv=["uv"] + args, name=name)
+            return process_id
+        label = f" ({name})" if name else ""
+        self.console.print(f"[bold cyan]======================[/]")
+        self.console.print(f"[bold cyan]Running UV command{label}:[/] {' '.join(['uv'] + args)}")
+        self.console.print(f"[bold cyan]======================[/]")
+        return None
+
+    def print_output(self, process_id: int | None, stream: str, line: str):
+        if events.enabled:
+            events.emit("process.output", process=process_id, stream=stream, data=line)
+        elif stream == "stderr":
+            self.console.print(f"[bold red]{line.rstrip()}[/]")
+        else:
+            self.console.print(line.rstrip())
+
+    def print_footer(self, returncode: int | None, process_id: int | None = None,
+                     duration: float | None = None, cancelled: bool = False):
+        if events.enabled:
+            events.emit("process.end", process=process_id, exit_code=returncode, duration=duration, cancelled=cancelled)
+            return
+        self.console.print(f"[bold cyan]======================[/]")
+        self.console.print(f"[bold cyan]Command completed with return code:[/] {returncode}")
+        self.console.print(f"[bold cyan]======================[/]")
+
+    def run_pipeline(self, gate: tuple[str, list[str]], jobs: dict[str, list[str]]) -> dict[str, int]:
+        """
+        Run the gate command and the jobs concurrently, cancelling the jobs
+        as soon as the gate fails.
+
+        The output of each command is buffered and printed as its own block
+        once the command finishes, so the logs of the steps never interleave.
+        With the event stream open, process events are emitted as they happen
+        instead and are told apart by their process id.
+        Returns the return code of every command; cancelled jobs report None.
+        The combined output of every finished command is kept in pipeline_output.
+        """
+        gate_name, gate_args = gate
+        commands = {gate_name: gate_args, **jobs}
+        processes: dict[str, subprocess.Popen] = {}
+        process_ids: dict[str, int | None] = {}
+        results: dict[str, int] = {name: None for name in commands}
+        finished = queue.Queue()
+        self.pipeline_output: dict[str, str] = {}
+
+        def cancel(names):
+            self._terminate_groups([processes[name] for name in names if name in processes])
+
+        def signal_handler(sig, frame):
+            self.notice("\n[bold yellow]Received interrupt signal. Terminating UV processes...[/]")
+            cancel(list(processes))
+            self.notice("[bold yellow]UV processes terminated.[/]")
+            sys.exit(130)  # 130 is the standard exit code for Ctrl+C
+
+        def collect(name, process, started):
+            output = {"stdout": [], "stderr": []}
+
+            def read(stream):
+                # One reader per pipe so neither can fill up and block the process
+                for line in getattr(process, stream):
+                    output[stream].append(line)
+                    if events.enabled:
+                        self.print_output(process_ids[name], stream, line)
+
+            readers = [threading.Thread(target=read, args=(stream,), daemon=True) for stream in output]
+            for reader in readers:
+                reader.start()
+            for reader in readers:
+                reader.join()
+            process.wait()
+            finished.put((name, "".join(output["stdout"]), "".join(output["stderr"]), time.monotonic() - started))
+
+        original_sigint_handler = signal.signal(signal.SIGINT, signal_handler)
+        try:
+            for name, args in commands.items():
+                try:
+                    processes[name] = subprocess.Popen(
+                        ["uv"] + args,
+                        stdout=subprocess.PIPE,
+                        stderr=subprocess.PIPE,
+                        text=True,
+                        start_new_session=True,
+                    )
+                except FileNotFoundError:
+                    self.notice("[bold red]Error:[/] UV is not installed or not in PATH")
+                    cancel(list(processes))
+                    return {name: 1 for name in commands}
+                started = time.monotonic()
+                process_ids[name] = self.print_header(args, name) if events.enabled else None
+                threading.Thread(target=collect, args=(name, processes[name], started), daemon=True).start()
+
+            cancelled = []
+            for _ in commands:
+                name, stdout, stderr, duration = finished.get()
+                if name in cancelled:
+                    if events.enabled:
+                        self.print_footer(None, process_ids[name], duration, cancelled=True)
+                    else:
+                        self.console.print(f"[bold yellow]Cancelled UV command ({name}):[/] {' '.join(['uv'] + commands[name])}")
+                    continue
+                results[name] = processes[name].returncode
+                self.pipeline_output[name] = stdout + stderr
+                if not events.enabled:
+                    self.print_header(commands[name], name)
+                    for line in stdout.splitlines(keepends=True):
+                        self.print_output(None, "stdout", line)
+                    for line in stderr.splitlines(keepends=True):
+                        self.print_output(None, "stderr", line)
+                self.print_footer(results[name], process_ids[name], duration)
+                if name == gate_name and results[name] != 0:
+                    cancelled = [job for job in jobs if results[job] is None]
+                    cancel(cancelled)
+            return results
+        finally:
+            signal.signal(signal.SIGINT, original_sigint_handler)
+
+    @staticmethod
+    def _signal_group(process: subprocess.Popen, sig: int) -> bool:
+        """
+        Signal the process group led by process, False when none of it is left
+        """
+        try:
+            os.killpg(process.pid, sig)
+        except ProcessLookupError:
+            return False
+        return True
+
+    def _terminate_groups(self, processes: list[subprocess.Popen], timeout: float = 2):
+        """
+        Terminate the process groups of commands started with start_new_session.
+
+        uv doesn't stop the build backends it spawned when it is terminated,
+        so the whole group is signalled and killed if any of it outlives the
+        timeout.
+        """
+        for process in processes:
+            self._signal_group(process, signal.SIGTERM)
+        deadline = time.monotonic() + timeout
+        for process in processes:
+            try:
+                process.wait(timeout=max(0, deadline - time.monotonic()))
+            except subprocess.TimeoutExpired:
+                pass
+        # Group members outlive the uv process that started them
+        while time.monotonic() < deadline and any(self._signal_group(process, 0) for process in processes):
+            time.sleep(0.05)
+        for process in processes:
+            self._signal_group(process, signal.SIGKILL)
+            process.wait()
+
+    def run(self, args: list[str], sync: bool = False) -> int:
+        """
+        uv run, skipping the environment sync while the environment
+        fingerprint still matches uv.lock, pyproject.toml and the interpreter
+        """
+        fingerprint = EnvironmentFingerprint()
+        if not sync and fingerprint.matches():
+            events.cache("environment", "hit")
+        else:
+            events.cache("environment", "miss")
+            with events.phase("sync"):
+                # --inexact keeps packages added outside the lockfile, as uv run's own sync does
+                sync_result = self.run_command(["sync", "--inexact"])
+            if sync_result != 0:
+                fingerprint.clear()
+                return sync_result
+            fingerprint.record()
+        with events.phase("run"):
+            return self.run_command(["run", "--no-sync"] + args)
+
     def install(self,
                 packages: list[str],
                 upgrade: bool = False, 
@@ -97,7 +287,7 @@ class UVExecution:
         if packages: 
             uv_cmd.extend(packages)
 
-        return self.run_command(uv_cmd)
+        return self._record_sync(self.run_command(uv_cmd))
 
 
     def uninstall(self,
@@ -106,5 +296,11 @@ class UVExecution:
         uv_cmd = ["remove"]
         if packages: 
             uv_cmd.extend(packages)
-        return self.run_command(uv_cmd)
+        return self._record_sync(self.run_command(uv_cmd))
+
+    def _record_sync(self, returncode: int) -> int:
+        # uv add/remove sync the environment as part of the command
+        if returncode == 0:
+            EnvironmentFingerprint().record()
+        return returncode
 
@@ -0,0 +1,5 @@
+from .base import LanguageBackend
+from .exceptions import LanguageError, UnsupportedLanguageError
+from .registry import LanguageRegistry, get_backend
+
+__all__ = ['LanguageBackend', 'LanguageError', 'UnsupportedLanguageError', 'LanguageRegistry', 'get_backend']
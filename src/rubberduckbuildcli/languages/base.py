@@ -0,0 +1,45 @@
+from abc import ABC, abstractmethod
+from pathlib import Path
+
+
+class LanguageBackend(ABC):
+    """
+    Base Language Backend
+
+    Backends are registered under the ``rubberduckbuildcli.languages`` entry
+    point group and selected by the ``Language`` of RubberDuckProject.json.
+    """
+    name = ""
+    default_packages: tuple[str, ...] = ()
+
+    @abstractmethod
+    def init(self) -> int:
+        """
+        Initialize the project tooling in the current directory
+        """
+
+    @abstractmethod
+    def add_dependencies(self, packages: list[str], upgrade: bool = False) -> int:
+        """
+        Add packages to the project dependencies
+        """
+
+    @abstractmethod
+    def remove_dependencies(self, packages: list[str]) -> int:
+        """
+        Remove packages from the project dependencies
+        """
+
+    @abstractmethod
+    def build(self) -> list[Path]:
+        """
+        Build the project into dist/ and return the artifacts written there.
+        Raises ProjectLintError when lint checks fail and ProjectBuildError
+        on any other failure.
+        """
+
+    @abstractmethod
+    def run(self, command: list[str], sync: bool = False) -> int:
+        """
+        Run a command inside the project environment
+        """
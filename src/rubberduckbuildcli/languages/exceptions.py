@@ -0,0 +1,9 @@
+class LanguageError(Exception):
+    """
+    Base Language Backend Exception
+    """
+
+class UnsupportedLanguageError(LanguageError):
+    """
+    Raised when no Backend is Registered for a Language
+    """
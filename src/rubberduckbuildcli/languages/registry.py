@@ -0,0 +1,119 @@
+import importlib
+import inspect
+import json
+import os
+import sys
+from pathlib import Path
+
+import typer
+
+from .base import LanguageBackend
+from ..helpers.events import events
+from ..helpers.files import write_json_atomic
+from .exceptions import LanguageError, UnsupportedLanguageError
+
+ENTRY_POINT_GROUP = "rubberduckbuildcli.languages"
+
+# Always available, even when the package metadata is not installed
+BUILTIN_BACKENDS = {
+    "python": "rubberduckbuildcli.languages.python:PythonBackend",
+}
+
+
+class LanguageRegistry:
+    """
+    Registry of language backends discovered through entry points.
+
+    Scanning entry points reads the metadata of every installed distribution,
+    so the result is cached on disk and only rediscovered when one of the
+    sys.path directories changed (installing or removing a distribution
+    touches its site-packages directory). Backend modules are only imported
+    once a project's Language selects them.
+    """
+    CACHE_VERSION = 1
+
+    def __init__(self):
+        app_dir = typer.get_app_dir("rubberduckbuildcli")
+        self.cache_path: Path = Path(app_dir) / "languages.json"
+        self._backends: dict[str, str] | None = None
+
+    def _environment_key(self) -> list:
+        key = [sys.prefix]
+        for entry in sys.path:
+            # The working directory is on sys.path but never holds installed distributions
+            if not entry or entry == os.getcwd():
+                continue
+            try:
+                key.append([entry, os.stat(entry).st_mtime_ns])
+            except OSError:
+                continue
+        return key
+
+    def _discover(self) -> dict[str, str]:
+        # importlib.metadata is only needed on a cache miss
+        from importlib.metadata import entry_points
+
+        backends = dict(BUILTIN_BACKENDS)
+        for entry_point in entry_points(group=ENTRY_POINT_GROUP):
+            backends[entry_point.name.lower()] = entry_point.value
+        return backends
+
+    def backends(self) -> dict[str, str]:
+        """
+        Mapping of lower-cased language name to ``module:attribute``
+        """
+        if self._backends is not None:
+            return self._backends
+
+        environment_key = self._environment_key()
+        try:
+            with open(self.cache_path, 'r') as cache_file:
+                cache = json.load(cache_file)
+            if cache.get("version") == self.CACHE_VERSION and cache.get("environment") == environment_key:
+                self._backends = cache["backends"]
+                events.cache("languages", "hit")
+                return self._backends
+        except (OSError, ValueError, KeyError):
+            pass
+
+        events.cache("languages", "miss")
+        self._backends = self._discover()
+        try:
+            write_json_atomic(self.cache_path, {
+                "version": self.CACHE_VERSION,
+                "environment": environment_key,
+                "backends": self._backends,
+            }, indent=4)
+        except OSError:
+            # A read-only config directory only costs the rediscovery next run
+            pass
+        return self._backends
+
+    def load(self, language: str) -> type[LanguageBackend]:
+        """
+        Import and return the backend class registered for language
+        """
+        target = self.backends().get(language.lower())
+        if target is None:
+            raise UnsupportedLanguageError(
+                f"Unsupported language {language}. Available: {', '.join(sorted(self.backends()))}"
+            )
+        module_name, _, attribute = target.partition(":")
+        backend = importlib.import_module(module_name)
+        for name in attribute.split("."):
+            backend = getattr(backend, name)
+        return backend
+
+
+_registry = LanguageRegistry()
+
+
+def get_backend(language: str = "Python") -> LanguageBackend:
+    """
+    Instantiate the backend for a project Language
+    """
+    backend_class = _registry.load(language)
+    if inspect.isabstract(backend_class):
+        missing = ", ".join(sorted(backend_class.__abstractmethods__))
+        raise LanguageError(f"Language backend {backend_class.__name__} doesn't implement: {missing}")
+    return backend_class()
@@ -1,8 +1,13 @@
 import json
+import sys
 from pathlib import Path
+from typing import Optional
 import typer
 
 import rubberduckbuildcli.projects as projects
+import rubberduckbuildcli.completion as completion
+import rubberduckbuildcli.cache as cache
+from rubberduckbuildcli.helpers.events import EventFormat, events
 
 
 class CLIException(Exception):
@@ -13,6 +18,8 @@ class CLINoConfigException(CLIException):
 
 app = typer.Typer()
 app.add_typer(projects.app, name="project")
+app.add_typer(completion.app, name="completion")
+app.add_typer(cache.app, name="cache")
 
 
 @app.command("configure")
@@ -29,6 +36,9 @@ def configure_cli_options(show: bool = False):
             },
             "projects": {
                 "directory": "~/projects"
+            },
+            "cache": {
+                "url": ""
             }
         }
         config_path.parent.mkdir(parents=True, exist_ok=True)
@@ -49,8 +59,28 @@ def configure_cli_options(show: bool = False):
 
 
 
+def invoked_command_path(ctx: typer.Context, argv: list[str]) -> str:
+    """
+    Full path of the subcommand being invoked, e.g. "project build"
+    """
+    command, path = ctx.command, []
+    for arg in argv:
+        if not hasattr(command, "get_command"):
+            break
+        sub_command = command.get_command(ctx, arg)
+        if sub_command is not None:
+            path.append(arg)
+            command = sub_command
+    return " ".join(path)
+
+
 @app.callback(invoke_without_command=True)
-def check_config_file(ctx: typer.Context):
+def check_config_file(ctx: typer.Context,
+                      events_format: Optional[EventFormat] = typer.Option(None, "--events", help="Write a machine readable event stream instead of rich output"),
+                      events_fd: int = typer.Option(1, "--events-fd", help="File descriptor the event stream is written to")):
+    if events_format is not None and not ctx.resilient_parsing:
+        events.open(events_fd, command=invoked_command_path(ctx, sys.argv[1:]), argv=sys.argv[1:])
+
     if ctx.invoked_subcommand == "configure":
         return
 
@@ -61,6 +91,25 @@ def check_config_file(ctx: typer.Context):
         raise CLINoConfigException("No Personal Configuration... Run rdb configure")
 
 
+def main():
+    """
+    Console script entry point, closing the event stream with the exit code
+    """
+    try:
+        app()
+    except SystemExit as exit:
+        code = exit.code if isinstance(exit.code, int) else (0 if exit.code is None else 1)
+        events.close(code)
+        raise
+    except BaseException as error:
+        if not events.enabled:
+            raise
+        # command.end carries the error, so no traceback is rendered alongside the stream
+        code = 130 if isinstance(error, KeyboardInterrupt) else 1
+        events.close(code, error)
+        sys.exit(code)
+
+
 if __name__ == "__main__":
-    app()
+    main()
 
@@ -1,17 +1,35 @@
 import typer
 import json
+import os
 from typing import List, Optional
 from typing_extensions import Annotated
 from pathlib import Path
+from rich.console import Console
+from rich.table import Table
 
 from .configurations import BaseProjectConfiguration
-from .exceptions import ProjectBuildError, ProjectRunError
-from ..helpers.uv import UVExecution
+from .discovery import ProjectIndex
+from .exceptions import ProjectError, ProjectRunError
+from ..helpers.events import events
 from ..helpers.git import GitExecution
+from ..languages import get_backend
 from .github_workflows import GithubWorkflows
+from .workspace import WorkspaceGraph
 
 app = typer.Typer()
 
+
+def project_backend():
+    """
+    Language backend for the project in the current directory, Python when
+    there is no project configuration yet.
+    """
+    project_config = BaseProjectConfiguration()
+    if project_config.config_exists(throw_error=False):
+        return get_backend(project_config.get("Language"))
+    return get_backend()
+
+
 @app.command("print")
 def testing_cli_function(personal_config: bool = False):
     """
@@ -32,34 +50,38 @@ def testing_cli_function(personal_config: bool = False):
         
 
 @app.command()
-def init(app: str = "default", version:str = "0.1.0", skip_init: bool = False, skip_github: bool = True):
+def init(app: str = "default", version:str = "0.1.0", language: str = "Python", skip_init: bool = False, skip_github: bool = True):
     """
     Initialize a project
     :param app:
     :param version:
+    :param language:
     :return:
     """
     # Create RubberDuckProject.json
-    # Initialize Python Project (UV)
-    uv = UVExecution()
+    # Initialize the Language Project (e.g. UV for Python)
     git = GitExecution()
     app_dir = typer.get_app_dir("rubberduckbuildcli")
     config_path: Path = Path(app_dir) / "config.json"
     with open(config_path, 'r') as file: 
         user_config = json.load(file)
 
+    project_config = BaseProjectConfiguration()
+    if project_config.config_exists(throw_error=False):
+        backend = project_backend()
+    else:
+        # Resolve the backend first so an unsupported language is never written to the configuration
+        backend = get_backend(language)
     if not skip_init:
         print(f"Initialize {app} version {version}")
-        project_config = BaseProjectConfiguration()
-        if project_config.config_exists(throw_error=False):
-            pass
-        else: 
-            project_config.create_default_config(project_name=app)
-        uv.run_command(args=["init"])
+        if not project_config.config_exists(throw_error=False):
+            project_config.create_default_config(project_name=app, language=language)
+    if not skip_init:
+        backend.init()
     # Add default Packages 
-    print("Installing/Updating Default Packages")
-    default_packages = ["ruff"]
-    uv.install(packages=default_packages, upgrade=True)
+    if backend.default_packages:
+        print("Installing/Updating Default Packages")
+        backend.add_dependencies(packages=list(backend.default_packages), upgrade=True)
     
     # Create the initial Folder Paths
     # Display Information and helpful hints
@@ -75,7 +97,12 @@ def setup_workflows():
     if project_config.config_exists():
         print("Seting up workflows...")
         ghwf = GithubWorkflows()
-        ghwf.generate_artifact_zip_workflow(project_config)
+        artifact_config = project_config.get("GithubWF", {}).get("Artifact_python_zip", {})
+        graph = WorkspaceGraph(member_globs=artifact_config.get("packages"))
+        if graph.packages():
+            ghwf.generate_package_workflows(project_config, graph)
+        else:
+            ghwf.generate_artifact_zip_workflow(project_config)
 
 
 
@@ -84,14 +111,14 @@ def dependency_add(package: Annotated[Optional[List[str]], typer.Option()] = Non
     """
     Add dependecy to project.
     """
-    uv = UVExecution()
+    backend = project_backend()
     to_install_packages = []
     if not package:
         raise typer.Abort()
     for p in package:
         print(f"Installing Package {p}")
         to_install_packages.extend([p])
-    uv.install(packages=to_install_packages)
+    backend.add_dependencies(packages=to_install_packages)
 
 
 @app.command()
@@ -99,34 +126,61 @@ def dependency_remove(package: Annotated[Optional[List[str]], typer.Option()] =
     """
     Remove dependecy to project.
     """
-    uv = UVExecution()
+    backend = project_backend()
     to_remove_packages = []
     if not package:
         raise typer.Abort()
     for p in package:
         print(f"Removing Package {p}")
         to_remove_packages.extend([p])
-    uv.uninstall(packages=to_remove_packages)
+    backend.remove_dependencies(packages=to_remove_packages)
 
 @app.command("build")
-def project_build():
+def project_build(cache: bool = True):
     """
     Build the package
-    """
-    uv = UVExecution()
-    print("Checking Formatting and Sytling")
-    format_result = uv.run_command(["run", "ruff", "check"])
-    if format_result != 0:
-        raise ProjectBuildError("Ruff Checks Failed")
-    
-    print("Building Application")
 
-    uv.run_command(["build"])
+    With a remote cache configured (cache.url or RUBBERDUCK_CACHE_URL) the
+    dist/ artifacts and lint result of unchanged inputs are fetched instead.
+    """
+    # Imported here so other commands and completion don't pay for the HTTP client
+    from ..cache.build import CachedBuild
+    from ..cache.client import RemoteCache
+
+    backend = project_backend()
+    remote_cache = RemoteCache.from_personal_config() if cache else None
+    try:
+        with events.phase("build"):
+            if remote_cache:
+                CachedBuild(backend, remote_cache).build()
+            else:
+                backend.build()
+    except ProjectError:
+        record_build_status("failed")
+        raise
+    record_build_status("passed")
+
+def record_build_status(status: str):
+    try:
+        project_index = ProjectIndex.from_personal_config()
+        with project_index.locked():
+            project_index.record_build(os.getcwd(), status)
+            project_index.save()
+    except (OSError, ValueError) as error:
+        # The build result matters more than the index entry
+        print(f"Could not record build status: {error}")
+
+def complete_extra_commands(incomplete: str):
+    return [name for name in BaseProjectConfiguration().extra_command_names() if name.startswith(incomplete)]
 
 @app.command("run")
-def run_project():
+def run_project(task: Annotated[str, typer.Argument(autocompletion=complete_extra_commands)] = "run",
+                sync: bool = False):
     """
-    Run Project ExtraCommand Run
+    Run Project ExtraCommand (defaults to run)
+
+    The environment is only synced when uv.lock, pyproject.toml or the
+    interpreter changed since the last sync, or when --sync is passed.
     """
     project_config = BaseProjectConfiguration()
     if project_config.config_exists():
@@ -134,14 +188,62 @@ def run_project():
         print(f"Project Path: {project_config.project_config_file_path}")
         project_config.load_config()
         project_commands = project_config.project_configuration.get("ExtraCommands")
-        config_run_command = [cmd for cmd in project_commands if cmd.get('run')]
+        config_run_command = [cmd for cmd in project_commands if cmd.get(task)]
         if config_run_command:
-            run_command = ['run']
-            run_command.extend(config_run_command[0].get('run').split(' '))
-            uv = UVExecution()
-            uv.run_command(run_command)
+            run_command = config_run_command[0].get(task).split(' ')
+            backend = get_backend(project_config.get("Language"))
+            returncode = backend.run(run_command, sync=sync)
+            if returncode != 0:
+                raise typer.Exit(returncode)
         else: 
-            raise ProjectRunError("No Run Command Found")            
+            raise ProjectRunError(f"No {task} Command Found")            
+
+
+def print_projects(projects: list[dict]):
+    if events.enabled:
+        for project in projects:
+            events.emit("project", **project)
+        return
+    table = Table("Name", "Language", "Last Build", "Path")
+    for project in projects:
+        table.add_row(project["ProjectName"], project["Language"], project["BuildStatus"], project["Path"])
+    Console().print(table)
+
+
+@app.command("list")
+def list_projects(rescan: bool = False):
+    """
+    List the projects under the configured projects directory
+    """
+    project_index = ProjectIndex.from_personal_config()
+    with project_index.locked():
+        project_index.refresh(full=rescan).save()
+    print_projects(project_index.projects())
+
+
+@app.command("find")
+def find_projects(name: Annotated[Optional[str], typer.Argument(help="Name or glob pattern")] = None,
+                  language: Optional[str] = None,
+                  status: Annotated[Optional[str], typer.Option(help="Last build status: passed, failed or never")] = None,
+                  attr: Annotated[Optional[List[str]], typer.Option(help="KEY=VALUE, e.g. LanguageVersion=3.12")] = None,
+                  rescan: bool = False):
+    """
+    Find projects under the configured projects directory by name and attributes
+    """
+    attributes = {"Language": language, "BuildStatus": status}
+    for query in attr or []:
+        key, separator, value = query.partition("=")
+        if not separator:
+            raise typer.BadParameter(f"Expected KEY=VALUE, got {query}", param_hint="--attr")
+        attributes[key] = value
+    project_index = ProjectIndex.from_personal_config()
+    with project_index.locked():
+        project_index.refresh(full=rescan).save()
+    projects = project_index.find(name, **attributes)
+    if not projects:
+        print("No matching projects found")
+        raise typer.Exit(1)
+    print_projects(projects)
 
 
 if __name__=="__main__":
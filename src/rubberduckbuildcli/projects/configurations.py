@@ -28,8 +28,8 @@ class ProjectConfigurationFile(BaseModel):
         return getattr(self, key, default)   
 
 class BaseProjectConfiguration:
-    def __init__(self):
-        self.project_path = os.getcwd()
+    def __init__(self, project_path: str | None = None):
+        self.project_path = project_path or os.getcwd()
         self.project_config_file = "RubberDuckProject.json"
         self.project_config_file_path = os.path.join(self.project_path,"RubberDuckProject.json")
         self.project_configuration = None
@@ -65,6 +65,17 @@ class BaseProjectConfiguration:
             return getattr(self.project_configuration, key)
         return default
 
+    def extra_command_names(self) -> list[str]:
+        """
+        Names of the ExtraCommands tasks, in the order they are configured.
+        """
+        if not self.config_exists(throw_error=False):
+            return []
+        names = []
+        for command in self.get("ExtraCommands", []):
+            names.extend(name for name in command if name not in names)
+        return names
+
     def create_default_config(self, project_name="DefaultProject", language="Python", language_version="3.10"):
         """
         Create a default configuration file if one doesn't exist.
@@ -0,0 +1,186 @@
+import fcntl
+import fnmatch
+import json
+import os
+import time
+from contextlib import contextmanager
+from pathlib import Path
+
+import typer
+
+from ..helpers.files import write_json_atomic
+
+PROJECT_CONFIG_FILE = "RubberDuckProject.json"
+
+# Directories that never hold projects worth indexing
+SKIPPED_DIRECTORIES = {"node_modules", "__pycache__"}
+
+
+class ProjectIndex:
+    """
+    On-disk index of every RubberDuckProject.json below the projects directory.
+
+    Each scanned directory is stored with its mtime and subdirectories. A
+    directory's mtime only changes when entries are added, removed or renamed
+    directly inside it, so on a rescan unchanged directories are not listed
+    again; only their subdirectories are stat'ed. Project files are re-read
+    only when their own mtime changed.
+    """
+    INDEX_VERSION = 1
+
+    def __init__(self, projects_directory: str):
+        # Real paths, so symlinked project directories match the working directory of a build
+        self.root = os.path.realpath(os.path.expanduser(projects_directory))
+        app_dir = typer.get_app_dir("rubberduckbuildcli")
+        self.index_path: Path = Path(app_dir) / "projects-index.json"
+        self.data = self.empty()
+
+    @classmethod
+    def from_personal_config(cls) -> 'ProjectIndex':
+        app_dir = typer.get_app_dir("rubberduckbuildcli")
+        config_path: Path = Path(app_dir) / "config.json"
+        with open(config_path, 'r') as file:
+            user_config = json.load(file)
+        return cls(user_config.get("projects", {}).get("directory", "~/projects"))
+
+    def empty(self) -> dict:
+        return {"version": self.INDEX_VERSION, "root": self.root, "directories": {}, "projects": {}, "builds": {}}
+
+    def load(self):
+        try:
+            with open(self.index_path, 'r') as index_file:
+                data = json.load(index_file)
+        except (OSError, ValueError):
+            data = None
+        if not data or data.get("version") != self.INDEX_VERSION:
+            data = self.empty()
+        if data["root"] != self.root:
+            # The projects directory moved; build statuses are keyed by absolute path and still apply
+            data = {**self.empty(), "builds": data.get("builds", {})}
+        self.data = data
+        return self
+
+    @contextmanager
+    def locked(self):
+        """
+        Load the index and hold an exclusive lock on it until the block ends,
+        so concurrent load, modify and save cycles don't lose each other's updates.
+        """
+        self.index_path.parent.mkdir(parents=True, exist_ok=True)
+        with open(self.index_path.with_suffix(".lock"), 'w') as lock_file:
+            fcntl.flock(lock_file, fcntl.LOCK_EX)
+            yield self.load()
+
+    def save(self):
+        write_json_atomic(self.index_path, self.data)
+
+    def refresh(self, full: bool = False):
+        """
+        Bring the index up to date with the projects directory.
+        """
+        old_directories = {} if full else self.data["directories"]
+        old_projects = {} if full else self.data["projects"]
+        directories = {}
+        projects = {}
+
+        stack = [self.root]
+        while stack:
+            directory = stack.pop()
+            try:
+                mtime = os.stat(directory).st_mtime_ns
+            except OSError:
+                continue
+            entry = old_directories.get(directory)
+            if not entry or entry["mtime"] != mtime:
+                entry = self._scan_directory(directory, mtime)
+                if entry is None:
+                    continue
+            directories[directory] = entry
+            if entry["project"]:
+                project = self._read_project(directory, old_projects.get(directory))
+                if project:
+                    projects[directory] = project
+            stack.extend(os.path.join(directory, name) for name in entry["subdirs"])
+
+        self.data["directories"] = directories
+        self.data["projects"] = projects
+        return self
+
+    def _scan_directory(self, directory: str, mtime: int) -> dict | None:
+        subdirs = []
+        has_project = False
+        try:
+            with os.scandir(directory) as entries:
+                for dir_entry in entries:
+                    if dir_entry.name == PROJECT_CONFIG_FILE:
+                        has_project = dir_entry.is_file()
+                    elif (dir_entry.is_dir(follow_symlinks=False)
+                          and not dir_entry.name.startswith(".")
+                          and dir_entry.name not in SKIPPED_DIRECTORIES):
+                        subdirs.append(dir_entry.name)
+        except OSError:
+            return None
+        return {"mtime": mtime, "subdirs": sorted(subdirs), "project": has_project}
+
+    def _read_project(self, directory: str, cached: dict | None) -> dict | None:
+        config_path = os.path.join(directory, PROJECT_CONFIG_FILE)
+        try:
+            config_mtime = os.stat(config_path).st_mtime_ns
+        except OSError:
+            return None
+        if cached and cached["config_mtime"] == config_mtime:
+            return cached
+        try:
+            with open(config_path, 'r') as config_file:
+                config = json.load(config_file)
+        except (OSError, ValueError):
+            return None
+        return {
+            "ProjectName": config.get("ProjectName", os.path.basename(directory)),
+            "Language": config.get("Language", ""),
+            "LanguageVersion": config.get("LanguageVersion", ""),
+            "ProjectGitHubUrl": config.get("ProjectGitHubUrl", ""),
+            "config_mtime": config_mtime,
+        }
+
+    def projects(self) -> list[dict]:
+        """
+        Indexed projects with their path and last build status, sorted by name.
+        """
+        results = []
+        for path, project in self.data["projects"].items():
+            build = self.data["builds"].get(path, {})
+            results.append({
+                "ProjectName": project["ProjectName"],
+                "Language": project["Language"],
+                "LanguageVersion": project["LanguageVersion"],
+                "ProjectGitHubUrl": project["ProjectGitHubUrl"],
+                "Path": path,
+                "BuildStatus": build.get("status", "never"),
+                "BuiltAt": build.get("time"),
+            })
+        return sorted(results, key=lambda project: (project["ProjectName"].lower(), project["Path"]))
+
+    def find(self, pattern: str | None = None, **attributes) -> list[dict]:
+        """
+        Projects whose name matches the glob pattern (or contains it) and whose
+        attributes equal the given values, both case-insensitively.
+        """
+        results = []
+        for project in self.projects():
+            name = project["ProjectName"].lower()
+            if pattern:
+                query = pattern.lower()
+                if query not in name and not fnmatch.fnmatchcase(name, query):
+                    continue
+            if any(str(project.get(key, "")).lower() != str(value).lower()
+                   for key, value in attributes.items() if value is not None):
+                continue
+            results.append(project)
+        return results
+
+    def record_build(self, project_path: str, status: str):
+        """
+        Remember the outcome of the latest build of the project at project_path.
+        """
+        self.data["builds"][os.path.realpath(project_path)] = {"status": status, "time": time.time()}
@@ -9,6 +9,14 @@ class ProjectBuildError(ProjectError):
     Raised when Project Fails Build
     """
 
+class ProjectLintError(ProjectBuildError):
+    """
+    Raised when Project Fails Lint Checks
+    """
+    def __init__(self, message: str, output: str = ""):
+        super().__init__(message)
+        self.output = output
+
 class ProjectRunError(ProjectError):
     """
     Error Running the Project
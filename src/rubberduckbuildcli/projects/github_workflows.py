@@ -3,6 +3,11 @@ import os
 import yaml
 from pathlib import Path
 
+from .workspace import WorkspaceGraph
+
+# First line of the per-package workflows, so only files this tool wrote are ever removed
+PACKAGE_WORKFLOW_MARKER = "# Generated by rubberduck project setup-workflows for a workspace package"
+
 
 class GithubWorkflows:
     def __init__(self):
@@ -108,24 +113,19 @@ class GithubWorkflows:
         print("Generated Docker workflow: .github/workflows/docker-build.yml")
 
 
-    def generate_artifact_zip_workflow(self, config):
-        """Generate a workflow to create and upload a zip artifact."""
-        artifact_config = config.get("GithubWF", {}).get("Artifact_python_zip", {})
-        if not artifact_config:
-            print("No Artifact_zip workflow configuration found")
-            return
-
-        artifact_name = artifact_config.get("name", config.get("name", "artifact"))
-        paths_to_include = artifact_config.get("include", ["**/*"])
-        paths_to_exclude = artifact_config.get("exclude", [])
-
+    def artifact_workflow(self, artifact_config: dict, name: str, artifact_name: str,
+                          build_commands: str, paths_to_include, paths: list[str] | None = None) -> dict:
+        """Workflow that builds the project and uploads the results as an artifact."""
+        push = {
+            "branches": ["main"],
+            "tags": ["v*"]
+        }
+        if paths:
+            push["paths"] = paths
         workflow = {
-            "name": "Build and Upload Artifact",
+            "name": name,
             "on": {
-                "push": {
-                    "branches": ["main"],
-                    "tags": ["v*"]
-                }
+                "push": push
             },
             "jobs": {
                 "build": {
@@ -145,7 +145,7 @@ class GithubWorkflows:
                         },
                         {
                             "name": "Build project",
-                            "run": artifact_config.get("build_commands", "echo 'No build required'")
+                            "run": build_commands
                         },
                         {
                             "name": "Upload artifact",
@@ -184,14 +184,95 @@ class GithubWorkflows:
         }
 
         # Handle path exclusions
+        paths_to_exclude = artifact_config.get("exclude", [])
         if paths_to_exclude:
             workflow["jobs"]["build"]["steps"][-1]["with"]["exclude"] = paths_to_exclude
+        return workflow
+
+    def generate_artifact_zip_workflow(self, config):
+        """Generate a workflow to create and upload a zip artifact."""
+        artifact_config = config.get("GithubWF", {}).get("Artifact_python_zip", {})
+        if not artifact_config:
+            print("No Artifact_zip workflow configuration found")
+            return
+
+        artifact_name = artifact_config.get("name", config.get("name", "artifact"))
+        paths_to_include = artifact_config.get("include", ["**/*"])
+
+        workflow = self.artifact_workflow(
+            artifact_config,
+            name="Build and Upload Artifact",
+            artifact_name=artifact_name,
+            build_commands=artifact_config.get("build_commands", "echo 'No build required'"),
+            paths_to_include=paths_to_include,
+        )
 
         with open(self.workflow_dir / "artifact-upload.yml", "w") as f:
             yaml.dump(workflow, f, sort_keys=False)
 
         print("Generated Artifact workflow: .github/workflows/artifact-upload.yml")
 
+    def generate_package_workflows(self, config, graph: WorkspaceGraph):
+        """
+        Generate one artifact workflow per workspace package.
+
+        Each workflow only runs when the package's own sources, the sources of
+        a package it depends on, or the shared lock/project files change, so
+        a push builds the packages it touches plus their dependents.
+        """
+        artifact_config = config.get("GithubWF", {}).get("Artifact_python_zip", {})
+        if not artifact_config:
+            print("No Artifact_zip workflow configuration found")
+            return
+
+        artifact_name = artifact_config.get("name", config.get("name", "artifact"))
+        generated = set()
+        for package_name, package in graph.packages().items():
+            workflow_file = f"artifact-upload-{package_name}.yml"
+            paths = graph.source_paths(package_name) + [
+                "pyproject.toml",
+                "uv.lock",
+                f".github/workflows/{workflow_file}",
+            ]
+            out_dir = f"dist/{package_name}"
+            build_commands = artifact_config.get("package_build_commands", "uv build --package {package} --out-dir {out_dir}")
+            workflow = self.artifact_workflow(
+                artifact_config,
+                name=f"Build and Upload {package['name']}",
+                artifact_name=f"{artifact_name}-{package_name}",
+                build_commands=build_commands.format(package=package["name"], out_dir=out_dir),
+                paths_to_include=f"{out_dir}/",
+                paths=paths,
+            )
+            workflow["jobs"]["release"]["steps"][-1]["with"]["files"] = "artifacts/**/*"
+
+            with open(self.workflow_dir / workflow_file, "w") as f:
+                f.write(PACKAGE_WORKFLOW_MARKER + "\n")
+                yaml.dump(workflow, f, sort_keys=False)
+            generated.add(workflow_file)
+            print(f"Generated Artifact workflow: .github/workflows/{workflow_file}")
+            if package["closure"]:
+                print(f"    also runs for changes to: {', '.join(package['closure'])}")
+
+        # The single project workflow would still rebuild everything on every push
+        single_workflow = self.workflow_dir / "artifact-upload.yml"
+        if single_workflow.is_file():
+            single_workflow.unlink()
+            print("Removed workflow replaced by the package workflows: .github/workflows/artifact-upload.yml")
+
+        # Remove generated workflows of packages that left the workspace
+        for stale in self.workflow_dir.glob("artifact-upload-*.yml"):
+            if stale.name not in generated and self.is_package_workflow(stale):
+                stale.unlink()
+                print(f"Removed stale workflow: .github/workflows/{stale.name}")
+
+    def is_package_workflow(self, path: Path) -> bool:
+        try:
+            with open(path, "r") as f:
+                return f.readline().rstrip("\n") == PACKAGE_WORKFLOW_MARKER
+        except OSError:
+            return False
+
 # def generate_executable_workflow(config, workflows_dir):
 #     """Generate a workflow to build and release executables."""
 #     executable_config = config.get("GitHubWF", {}).get("executable", {})
@@ -0,0 +1,172 @@
+import glob
+import hashlib
+import json
+import os
+import re
+import tomllib
+from pathlib import Path
+
+import typer
+
+from ..helpers.events import events
+from ..helpers.files import write_json_atomic
+
+REQUIREMENT_NAME = re.compile(r"^\s*([A-Za-z0-9][A-Za-z0-9._-]*)")
+
+
+def normalize_name(name: str) -> str:
+    """
+    PEP 503 normalized package name
+    """
+    return re.sub(r"[-_.]+", "-", name).lower()
+
+
+class WorkspaceGraph:
+    """
+    Packages of a uv workspace and the dependencies between them.
+
+    Members come from ``[tool.uv.workspace]`` in the root pyproject.toml (or
+    the ``packages`` globs of the workflow configuration). The graph is cached
+    in the CLI config directory and only recomputed when the member list or
+    one of the pyproject.toml files changed.
+    """
+    CACHE_VERSION = 1
+
+    def __init__(self, project_path: str | None = None, member_globs: list[str] | None = None):
+        self.project_path = Path(project_path or os.getcwd()).resolve()
+        self.member_globs = member_globs
+        app_dir = typer.get_app_dir("rubberduckbuildcli")
+        project_key = hashlib.sha256(str(self.project_path).encode()).hexdigest()[:16]
+        self.cache_path: Path = Path(app_dir) / "workspace-graphs" / f"{project_key}.json"
+        self._packages: dict[str, dict] | None = None
+
+    def _read_pyproject(self, path: Path) -> dict | None:
+        """
+        Parsed pyproject.toml, None (with a warning) when it can't be read
+        """
+        try:
+            with open(path, 'rb') as file:
+                return tomllib.load(file)
+        except (OSError, tomllib.TOMLDecodeError) as error:
+            print(f"Skipping unreadable {path}: {error}")
+            return None
+
+    def _member_directories(self) -> list[str]:
+        root_pyproject = self.project_path / "pyproject.toml"
+        member_globs, exclude_globs = self.member_globs, []
+        if member_globs is None:
+            if not root_pyproject.is_file():
+                return []
+            root = self._read_pyproject(root_pyproject)
+            if root is None:
+                return []
+            workspace = root.get("tool", {}).get("uv", {}).get("workspace", {})
+            member_globs = workspace.get("members", [])
+            exclude_globs = workspace.get("exclude", [])
+
+        def expand(patterns):
+            matches = set()
+            for pattern in patterns:
+                for match in glob.glob(pattern, root_dir=self.project_path):
+                    matches.add(Path(match).as_posix())
+            return matches
+
+        members = expand(member_globs) - expand(exclude_globs)
+        return sorted(member for member in members if (self.project_path / member / "pyproject.toml").is_file())
+
+    def _cache_key(self, members: list[str]) -> list:
+        key = []
+        for directory in ["."] + members:
+            pyproject = self.project_path / directory / "pyproject.toml"
+            try:
+                stat = pyproject.stat()
+            except FileNotFoundError:
+                continue
+            key.append([directory, stat.st_mtime_ns, stat.st_size])
+        return key
+
+    def _compute(self, members: list[str]) -> dict[str, dict]:
+        packages = {}
+        requirements = {}
+        for directory in members:
+            pyproject = self._read_pyproject(self.project_path / directory / "pyproject.toml")
+            if pyproject is None:
+                continue
+            project = pyproject.get("project", {})
+            name = normalize_name(project.get("name", Path(directory).name))
+            dependencies = list(project.get("dependencies", []))
+            for extra in project.get("optional-dependencies", {}).values():
+                dependencies.extend(extra)
+            packages[name] = {"name": project.get("name", name), "directory": directory}
+            requirements[name] = dependencies
+
+        for name, dependencies in requirements.items():
+            internal = set()
+            for requirement in dependencies:
+                match = REQUIREMENT_NAME.match(requirement)
+                if match and normalize_name(match.group(1)) in packages:
+                    internal.add(normalize_name(match.group(1)))
+            internal.discard(name)
+            packages[name]["dependencies"] = sorted(internal)
+
+        for name in packages:
+            packages[name]["closure"] = sorted(self._closure(packages, name))
+        return packages
+
+    def _closure(self, packages: dict[str, dict], name: str) -> set[str]:
+        """
+        Transitive internal dependencies of name
+        """
+        seen = set()
+        stack = list(packages[name]["dependencies"])
+        while stack:
+            dependency = stack.pop()
+            if dependency in seen or dependency == name:
+                continue
+            seen.add(dependency)
+            stack.extend(packages[dependency]["dependencies"])
+        return seen
+
+    def packages(self) -> dict[str, dict]:
+        """
+        Normalized package name -> name, directory, direct internal
+        dependencies and their transitive closure
+        """
+        if self._packages is not None:
+            return self._packages
+
+        members = self._member_directories()
+        cache_key = self._cache_key(members)
+        try:
+            with open(self.cache_path, 'r') as cache_file:
+                cache = json.load(cache_file)
+            if cache.get("version") == self.CACHE_VERSION and cache.get("key") == cache_key:
+                self._packages = cache["packages"]
+                events.cache("workspace-graph", "hit")
+                return self._packages
+        except (OSError, ValueError, KeyError):
+            pass
+
+        events.cache("workspace-graph", "miss")
+        self._packages = self._compute(members)
+        try:
+            write_json_atomic(self.cache_path, {"version": self.CACHE_VERSION, "key": cache_key, "packages": self._packages}, indent=4)
+        except OSError:
+            # The graph is recomputed next run instead
+            pass
+        return self._packages
+
+    def dependents(self, name: str) -> list[str]:
+        """
+        Packages that (transitively) depend on name
+        """
+        return sorted(other for other, package in self.packages().items() if name in package["closure"])
+
+    def source_paths(self, name: str) -> list[str]:
+        """
+        Directories whose changes affect the build of name: its own sources
+        and those of every package it depends on.
+        """
+        packages = self.packages()
+        directories = [packages[name]["directory"]] + [packages[dependency]["directory"] for dependency in packages[name]["closure"]]
+        return ["**" if directory == "." else f"{directory}/**" for directory in directories]